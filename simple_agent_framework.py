@@ -2,19 +2,93 @@
 # Minimal implementation focused on getting you running quickly
 
 import asyncio
-import aiohttp
+import httpx
+import operator
 import os
-from typing import Dict, List, TypedDict, Literal
+from typing import Annotated, Dict, List, Optional, TypedDict, Literal
 from datetime import datetime
 from langgraph.graph import StateGraph, END
-import json
+import orjson
+import websockets
+from dataclasses import dataclass
+from urllib.parse import quote
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass  # uvloop is Linux/macOS only; the default loop works everywhere
+
 load_dotenv()
 
 # ============== Configuration ==============
 COORDINATOR_URL = os.getenv('COORDINATOR_URL', 'http://localhost:8787')
+# When the coordinator is on the same host it can bind a Unix domain socket,
+# which skips the TCP loopback stack for the chatty dashboard traffic
+COORDINATOR_SOCKET = os.getenv('COORDINATOR_SOCKET')
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+MAX_PARALLEL_TASKS = int(os.getenv('MAX_PARALLEL_TASKS', '4'))
+APPROVAL_DELAY = float(os.getenv('APPROVAL_DELAY_SECONDS', '3'))
+
+# Dashboard calls are best-effort telemetry; keep them on a short leash so a
+# slow endpoint can't hold connections out of the pool
+DASHBOARD_TIMEOUT = httpx.Timeout(2.0, connect=0.5)
+
+# Pre-serialize payloads with orjson (C implementation, several times faster
+# than stdlib json) instead of letting httpx run them through json.dumps
+_JSON_HEADERS = {"content-type": "application/json"}
+
+ITERATION_STATUS_URL = f"{COORDINATOR_URL}/api/iteration/status"
+COORDINATOR_WS_URL = COORDINATOR_URL.replace('http', 'ws', 1)
+
+# ============== Shared HTTP Client ==============
+_client: Optional[httpx.AsyncClient] = None
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it lazily.
+
+    A single client lets all agents reuse one connection pool, and with
+    HTTP/2 enabled the small dashboard POSTs multiplex over one connection
+    instead of each paying a new TCP handshake.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        transport = None
+        if COORDINATOR_SOCKET:
+            transport = httpx.AsyncHTTPTransport(
+                uds=COORDINATOR_SOCKET, http2=True, limits=limits
+            )
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=limits,
+            timeout=30.0,
+            transport=transport
+        )
+    return _client
+
+async def close_client():
+    """Close the shared HTTP client if it exists"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+# None = not probed yet; once False, all dashboard traffic short-circuits
+# instead of paying a failed connect per call
+DASHBOARD_AVAILABLE: Optional[bool] = None
+
+async def probe_dashboard():
+    """Check once whether the dashboard is reachable and set the flag"""
+    global DASHBOARD_AVAILABLE
+    client = await get_client()
+    try:
+        await client.get(ITERATION_STATUS_URL, timeout=0.5)
+        DASHBOARD_AVAILABLE = True
+    except httpx.HTTPError:
+        DASHBOARD_AVAILABLE = False
+        print("⚠️  Dashboard unreachable; skipping dashboard updates this run")
 
 # ============== State Definition ==============
 class IterationState(TypedDict):
@@ -23,129 +97,239 @@ class IterationState(TypedDict):
     backlog: List[Dict]
     plan: Dict
     completed_tasks: List[str]
-    messages: List[str]
+    # operator.add lets nodes return just their new messages; LangGraph
+    # appends them instead of each node copying the whole list
+    messages: Annotated[List[str], operator.add]
 
 # ============== Simple Agent Base ==============
 class Agent:
     """Minimal agent that can execute tasks and report to dashboard"""
     
-    def __init__(self, name: str, role: str):
+    def __init__(self, name: str, role: str, client: httpx.AsyncClient):
         self.name = name
         self.role = role
-        self.session = None
-    
+        self.client = client
+        # Endpoints are constant for the agent's lifetime; build them once
+        self._url_register = f"{COORDINATOR_URL}/api/agent/register"
+        self._url_update = f"{COORDINATOR_URL}/api/agent/update"
+        self._url_activity = f"{COORDINATOR_URL}/api/activity/post"
+        self._url_ws = f"{COORDINATOR_WS_URL}/ws/agent?id={quote(self.name)}"
+        self.ws = None
+        self._tx_queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
     async def setup(self):
-        """Initialize HTTP session and register with dashboard"""
-        self.session = aiohttp.ClientSession()
+        """Register with dashboard and start the background update sender"""
+        if not DASHBOARD_AVAILABLE:
+            return
         try:
-            await self.session.post(
-                f"{COORDINATOR_URL}/api/agent/register",
-                json={"id": self.name, "name": self.name, "role": self.role}
+            await self.client.post(
+                self._url_register,
+                content=orjson.dumps({"id": self.name, "name": self.name, "role": self.role}),
+                headers=_JSON_HEADERS,
+                timeout=DASHBOARD_TIMEOUT
             )
-        except:
+        except httpx.HTTPError:
             print(f"Warning: Could not register {self.name} with dashboard")
-    
-    async def update_dashboard(self, status: str, message: str):
-        """Send status update to dashboard"""
+        # Prefer one persistent WebSocket for updates: ~6 bytes of framing per
+        # message instead of ~200 bytes of HTTP headers, and no per-call setup
         try:
-            await self.session.post(
-                f"{COORDINATOR_URL}/api/agent/update",
-                json={"agentId": self.name, "status": status, "activity": message}
-            )
-            await self.session.post(
-                f"{COORDINATOR_URL}/api/activity/post",
-                json={"agent": self.name, "message": message}
+            if COORDINATOR_SOCKET:
+                # Ride the same Unix socket the HTTP transport uses
+                self.ws = await websockets.unix_connect(
+                    COORDINATOR_SOCKET, self._url_ws, open_timeout=2
+                )
+            else:
+                self.ws = await websockets.connect(self._url_ws, open_timeout=2)
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+            self.ws = None  # Coordinator has no WS endpoint; fall back to POSTs
+        self._drain_task = asyncio.create_task(self._drain())
+
+    async def update_dashboard(self, status: str, message: str):
+        """Queue a status update for the dashboard (sent in the background)"""
+        if not DASHBOARD_AVAILABLE:
+            return
+        self._tx_queue.put_nowait((status, message))
+
+    async def _drain(self):
+        """Send queued dashboard updates without blocking the work loop"""
+        while True:
+            status, message = await self._tx_queue.get()
+            try:
+                await self._send_update(status, message)
+            except httpx.ConnectError:
+                # Dashboard went away mid-run; stop trying for everyone
+                global DASHBOARD_AVAILABLE
+                DASHBOARD_AVAILABLE = False
+            except httpx.HTTPError:
+                pass  # Dashboard updates are optional
+            finally:
+                self._tx_queue.task_done()
+
+    async def _send_update(self, status: str, message: str):
+        """Send one update over the WebSocket, or via HTTP POSTs as fallback"""
+        if self.ws is not None:
+            try:
+                # .decode() so this goes out as a TEXT frame; bytes would send
+                # BINARY and break coordinators doing JSON.parse(event.data)
+                await self.ws.send(orjson.dumps(
+                    {"agentId": self.name, "status": status, "activity": message, "message": message}
+                ).decode())
+                return
+            except (OSError, websockets.WebSocketException):
+                self.ws = None  # Socket died; use HTTP from here on
+        await asyncio.gather(
+            self.client.post(
+                self._url_update,
+                content=orjson.dumps({"agentId": self.name, "status": status, "activity": message}),
+                headers=_JSON_HEADERS,
+                timeout=DASHBOARD_TIMEOUT
+            ),
+            self.client.post(
+                self._url_activity,
+                content=orjson.dumps({"agent": self.name, "message": message}),
+                headers=_JSON_HEADERS,
+                timeout=DASHBOARD_TIMEOUT
             )
-        except:
-            pass  # Dashboard updates are optional
-    
+        )
+
     async def cleanup(self):
-        """Close HTTP session"""
-        if self.session:
-            await self.session.close()
+        """Flush pending dashboard updates and stop the background sender"""
+        if self._drain_task is not None:
+            await self._tx_queue.join()
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        if self.ws is not None:
+            await self.ws.close()
+            self.ws = None
 
 # ============== Core Workflow Nodes ==============
 
+@dataclass(slots=True, frozen=True)
+class Task:
+    """One unit of planned work; slots keep it far smaller than a dict"""
+    id: str
+    title: str
+    assignee: str
+
+# Every feature needs: backend → frontend → tests
+_TASK_KINDS = {
+    "backend": ("backend", "Backend"),
+    "frontend": ("frontend", "Frontend"),
+    "qa": ("tests", "Tests")
+}
+
+def _make_task(item: Dict, assignee: str) -> Task:
+    """Build one plan task for a backlog item and role"""
+    suffix, label = _TASK_KINDS[assignee]
+    return Task(
+        id=f"{item['id']}-{suffix}",
+        title=f"{label}: {item['title']}",
+        assignee=assignee
+    )
+
 async def planning_node(state: IterationState) -> Dict:
     """Convert backlog items into a simple task plan"""
     print("\n🎯 PLANNING PHASE")
-    
+
     # Create simple plan from backlog
-    tasks = []
-    for item in state["backlog"]:
-        # Every feature needs: backend → frontend → tests
-        feature_id = item["id"]
-        tasks.extend([
-            {"id": f"{feature_id}-backend", "title": f"Backend: {item['title']}", "assignee": "backend"},
-            {"id": f"{feature_id}-frontend", "title": f"Frontend: {item['title']}", "assignee": "frontend"},
-            {"id": f"{feature_id}-tests", "title": f"Tests: {item['title']}", "assignee": "qa"}
-        ])
-    
+    tasks = [
+        _make_task(item, assignee)
+        for item in state["backlog"]
+        for assignee in _TASK_KINDS
+    ]
+
     plan = {"tasks": tasks, "total_tasks": len(tasks)}
     print(f"📋 Created plan with {len(tasks)} tasks")
-    
+
     return {
         "phase": "approval",
         "plan": plan,
-        "messages": state["messages"] + [f"Created plan with {len(tasks)} tasks"]
+        "messages": [f"Created plan with {len(tasks)} tasks"]
     }
 
 async def approval_node(state: IterationState) -> Dict:
     """Simple approval - just wait a few seconds then auto-approve"""
     print("\n✅ APPROVAL PHASE")
-    print("🤔 Waiting for approval... (auto-approving in 3 seconds)")
-    
+    print(f"🤔 Waiting for approval... (auto-approving in {APPROVAL_DELAY:g} seconds)")
+
     # In real implementation, this would wait for dashboard approval
-    await asyncio.sleep(3)
+    await asyncio.sleep(APPROVAL_DELAY)
     
     print("✅ Plan approved!")
     return {
         "phase": "building",
-        "messages": state["messages"] + ["Plan approved by product owner"]
+        "messages": ["Plan approved by product owner"]
     }
 
 async def building_node(state: IterationState) -> Dict:
     """Simulate agents building the features"""
     print("\n🔨 BUILDING PHASE")
     
-    # Create agents
+    # One cheap probe up front beats a failed connect on every update
+    if DASHBOARD_AVAILABLE is None:
+        await probe_dashboard()
+
+    # Create agents sharing one HTTP client
+    client = await get_client()
     agents = {
-        "backend": Agent("Backend SWE", "engineer"),
-        "frontend": Agent("Frontend SWE", "engineer"),
-        "qa": Agent("QA Engineer", "tester")
+        "backend": Agent("Backend SWE", "engineer", client),
+        "frontend": Agent("Frontend SWE", "engineer", client),
+        "qa": Agent("QA Engineer", "tester", client)
     }
     
-    # Setup agents
-    for agent in agents.values():
-        await agent.setup()
+    # Setup agents (registrations are independent, so run them concurrently)
+    await asyncio.gather(*(agent.setup() for agent in agents.values()))
     
-    completed = []
     tasks = state["plan"]["tasks"]
-    
-    # Process tasks by type (simulate parallel work)
-    for task_type in ["backend", "frontend", "qa"]:
-        type_tasks = [t for t in tasks if t["assignee"] == task_type]
-        if type_tasks:
-            agent = agents[task_type]
-            print(f"\n👤 {agent.name} working on {len(type_tasks)} tasks...")
-            
-            for task in type_tasks:
-                await agent.update_dashboard("busy", f"Working on: {task['title']}")
-                await asyncio.sleep(1)  # Simulate work
-                
-                print(f"  ✓ Completed: {task['title']}")
-                completed.append(task["id"])
-                
-                await agent.update_dashboard("idle", f"Completed: {task['title']}")
+
+    # Bound concurrency so a big plan doesn't flood the dashboard
+    limiter = asyncio.Semaphore(MAX_PARALLEL_TASKS)
+
+    async def _do_task(agent: Agent, task: Task, done: List[str]):
+        async with limiter:
+            await agent.update_dashboard("busy", f"Working on: {task.title}")
+            await asyncio.sleep(1)  # Simulate work
+
+            print(f"  ✓ Completed: {task.title}")
+            done.append(task.id)
+
+            await agent.update_dashboard("idle", f"Completed: {task.title}")
+
+    async def _process_role(task_type: str, type_tasks: List[Task]) -> List[str]:
+        if not type_tasks:
+            return []
+
+        agent = agents[task_type]
+        print(f"\n👤 {agent.name} working on {len(type_tasks)} tasks...")
+
+        done: List[str] = []
+        await asyncio.gather(*(_do_task(agent, t, done) for t in type_tasks))
+        return done
+
+    # Group tasks by assignee in one pass instead of filtering per role
+    buckets: Dict[str, List[Task]] = {"backend": [], "frontend": [], "qa": []}
+    for t in tasks:
+        buckets[t.assignee].append(t)
+
+    # The three roles have no dependencies on each other, so run them in parallel
+    role_results = await asyncio.gather(
+        *(_process_role(task_type, type_tasks) for task_type, type_tasks in buckets.items())
+    )
+    completed = [task_id for done in role_results for task_id in done]
     
     # Cleanup
-    for agent in agents.values():
-        await agent.cleanup()
-    
+    await asyncio.gather(*(agent.cleanup() for agent in agents.values()))
+    await close_client()
+
     return {
         "phase": "complete",
         "completed_tasks": completed,
-        "messages": state["messages"] + [f"Completed {len(completed)} tasks"]
+        "messages": [f"Completed {len(completed)} tasks"]
     }
 
 # ============== Main Workflow ==============
@@ -167,26 +351,40 @@ def create_workflow() -> StateGraph:
     
     return workflow.compile()
 
+# Compile once at import; the graph is stateless between invocations since
+# all state is passed in explicitly, so one instance serves every iteration
+_WORKFLOW = create_workflow()
+
 # ============== Simple Runner ==============
 
+# Shared template for the starting state; tuples for the list fields so the
+# shared values are immutable, with fresh lists swapped in per iteration
+_INITIAL_TEMPLATE = {
+    "phase": "planning",
+    "plan": {},
+    "completed_tasks": (),
+    "messages": ()
+}
+
 async def run_iteration(backlog_items: List[Dict]):
     """Run a single iteration with given backlog items"""
+    global DASHBOARD_AVAILABLE
     print("🚀 Starting iteration...")
-    
+
+    # Re-probe each iteration so a transient coordinator outage doesn't
+    # disable dashboard updates for the lifetime of a long-lived process
+    DASHBOARD_AVAILABLE = None
+
     # Initial state
     initial_state = {
-        "phase": "planning",
+        **_INITIAL_TEMPLATE,
         "backlog": backlog_items,
-        "plan": {},
         "completed_tasks": [],
         "messages": []
     }
     
-    # Create and run workflow
-    workflow = create_workflow()
-    
-    # Execute workflow
-    final_state = await workflow.ainvoke(initial_state)
+    # Execute the pre-compiled workflow
+    final_state = await _WORKFLOW.ainvoke(initial_state)
     
     print("\n✨ ITERATION COMPLETE!")
     print(f"Completed tasks: {len(final_state['completed_tasks'])}")
@@ -202,13 +400,13 @@ async def main():
     # Test connection to dashboard (optional)
     print("🔗 Testing dashboard connection...")
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{COORDINATOR_URL}/api/iteration/status") as resp:
-                if resp.status == 200:
-                    print("✅ Dashboard connected!")
-                else:
-                    print("⚠️  Dashboard not responding (will continue anyway)")
-    except:
+        client = await get_client()
+        resp = await client.get(ITERATION_STATUS_URL, timeout=DASHBOARD_TIMEOUT)
+        if resp.status_code == 200:
+            print("✅ Dashboard connected!")
+        else:
+            print("⚠️  Dashboard not responding (will continue anyway)")
+    except httpx.HTTPError:
         print("⚠️  Dashboard not available (will continue anyway)")
     
     # Example backlog
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Celery worker for running iterations out-of-process.
+
+Callers enqueue with run_iteration_task.delay(backlog_items) and get a
+task id back immediately instead of awaiting the whole iteration in
+their own process. Iteration status is mirrored to Redis under
+iter:<task_id> so dashboards and callers can poll progress.
+
+Start a worker with:
+    celery -A worker worker --loglevel=info
+"""
+
+import asyncio
+import os
+
+import redis
+from celery import Celery
+
+from simple_agent_framework import run_iteration
+
+BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+STATE_URL = os.getenv('ITERATION_STATE_URL', 'redis://localhost:6379/1')
+
+app = Celery('agent_swarm', broker=BROKER_URL)
+
+_state = redis.Redis.from_url(STATE_URL)
+
+
+@app.task(bind=True, max_retries=3)
+def run_iteration_task(self, backlog_items):
+    """Run one iteration in a worker, retrying on failure"""
+    key = f"iter:{self.request.id}"
+    _state.hset(key, mapping={"phase": "running", "backlog_size": len(backlog_items)})
+    try:
+        asyncio.run(run_iteration(backlog_items))
+    except Exception as exc:
+        if self.request.retries >= self.max_retries:
+            # Out of retries; mark terminal so pollers don't wait forever
+            _state.hset(key, "phase", "failed")
+            raise
+        _state.hset(key, "phase", "retrying")
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+    _state.hset(key, "phase", "complete")